@@ -1,49 +1,125 @@
 """Binary reading helpers mirroring the C# BinaryReaderExtensions behavior.
 
 This module provides a small `BinaryReader` class that wraps a binary
-file-like object and provides convenient methods for reading primitives
-and the path-string format used in .NET bundles.
+file-like object, or in-memory data such as `bytes` or an `mmap`, and
+provides convenient methods for reading primitives and the path-string
+format used in .NET bundles.
 """
 from __future__ import annotations
 
+import mmap
 import struct
-from io import BufferedReader, BytesIO
-from typing import BinaryIO
+from typing import BinaryIO, Union
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+_I32 = struct.Struct("<i")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_U64 = struct.Struct("<Q")
 
 
 class BinaryReader:
     """Simple binary reader for little-endian primitives.
 
-    The reader expects the underlying stream to be seekable.
+    When constructed from a buffer (`bytes`, `bytearray`, `memoryview` or
+    `mmap`) the reader decodes directly from it, tracking its position with
+    an integer cursor. Otherwise the reader expects the underlying stream to
+    be seekable.
+
+    A buffer-backed reader holds a view on its buffer until `close` is called
+    (or the reader is used as a context manager); an `mmap` cannot be closed
+    while that view is alive.
     """
 
-    def __init__(self, stream: BinaryIO) -> None:
-        self._stream = stream
+    def __init__(self, source: BinaryIO | Buffer, offset: int = 0) -> None:
+        self._stream: BinaryIO | None = None
+        self._buf: memoryview | None = None
+        self._owns_view = False
+        self._pos = offset
+        if isinstance(source, memoryview):
+            self._buf = source
+        elif isinstance(source, (bytes, bytearray, mmap.mmap)):
+            self._buf = memoryview(source)
+            self._owns_view = True
+        else:
+            self._stream = source
+            if offset:
+                source.seek(offset)
+
+    def __enter__(self) -> "BinaryReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the view this reader created over its buffer, if any."""
+        if self._owns_view:
+            self._buf.release()
+            self._owns_view = False
+
+    @property
+    def buffer(self) -> memoryview | None:
+        """The view being read from, or None for a stream-backed reader."""
+        return self._buf
+
+    def tell(self) -> int:
+        if self._buf is None:
+            return self._stream.tell()
+        return self._pos
 
     def seek(self, offset: int, whence: int = 0) -> None:
-        self._stream.seek(offset, whence)
+        if self._buf is None:
+            self._stream.seek(offset, whence)
+        elif whence == 0:
+            self._pos = offset
+        elif whence == 1:
+            self._pos += offset
+        else:
+            self._pos = len(self._buf) + offset
+
+    def _advance(self, size: int) -> int:
+        """Move the buffer cursor forward by `size`, returning its old value."""
+        pos = self._pos
+        if pos < 0 or pos + size > len(self._buf):
+            raise EOFError("Unexpected end of stream")
+        self._pos = pos + size
+        return pos
 
     def read_bytes(self, size: int) -> bytes:
+        if self._buf is not None:
+            pos = self._advance(size)
+            return bytes(self._buf[pos : pos + size])
+
         data = self._stream.read(size)
         if len(data) != size:
             raise EOFError("Unexpected end of stream")
         return data
 
+    def read_struct(self, fmt: struct.Struct) -> tuple:
+        """Read and unpack all fields of a precompiled `struct.Struct` at once."""
+        if self._buf is not None:
+            return fmt.unpack_from(self._buf, self._advance(fmt.size))
+        return fmt.unpack(self.read_bytes(fmt.size))
+
     def read_byte(self) -> int:
+        if self._buf is not None:
+            return self._buf[self._advance(1)]
         data = self.read_bytes(1)
         return data[0]
 
     def read_int32(self) -> int:
-        return struct.unpack("<i", self.read_bytes(4))[0]
+        return self.read_struct(_I32)[0]
 
     def read_uint32(self) -> int:
-        return struct.unpack("<I", self.read_bytes(4))[0]
+        return self.read_struct(_U32)[0]
 
     def read_int64(self) -> int:
-        return struct.unpack("<q", self.read_bytes(8))[0]
+        return self.read_struct(_I64)[0]
 
     def read_uint64(self) -> int:
-        return struct.unpack("<Q", self.read_bytes(8))[0]
+        return self.read_struct(_U64)[0]
 
     def read_path_length(self) -> int:
         """Read the variable-length path length used by .NET bundle format.
@@ -64,7 +140,14 @@ class BinaryReader:
 
         return length
 
+    def read_path_bytes(self) -> bytes:
+        """Read a length-prefixed path, returning its raw UTF-8 bytes."""
+        return self.read_bytes(self.read_path_length())
+
     def read_path_string(self) -> str:
         length = self.read_path_length()
+        if self._buf is not None:
+            pos = self._advance(length)
+            return str(self._buf[pos : pos + length], "utf-8")
         raw = self.read_bytes(length)
         return raw.decode("utf-8")
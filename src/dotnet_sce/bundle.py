@@ -6,16 +6,188 @@ embedded files to disk.
 """
 from __future__ import annotations
 
+import logging
+import mmap
 import os
 import struct
+import threading
 import zlib
-from io import BytesIO
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterator, List, Optional
+
+try:
+    import deflate as _libdeflate
+except ImportError:  # optional dependency
+    _libdeflate = None
 
 from .binary_reader import BinaryReader
 from .bundle_header import BundleHeader
 from .bundle_file_entry import BundleFileEntry
 
+logger = logging.getLogger(__name__)
+
+# Bundle signature embedded in the apphost; the bundle header offset is stored
+# at a fixed distance before it.
+_BUNDLE_MARKER = b"38cc827-e34f-4453-9df4-1e796e9f1d07"
+
+# Rough per-entry size of the entry table (fixed fields plus a typical path),
+# used to size the read-ahead hint for the table.
+_ENTRY_SIZE_ESTIMATE = 128
+
+# Upper bound on the amount of entry data held in memory at once during extraction.
+_CHUNK_SIZE = 1 << 20
+
+# Entries up to this decompressed size are inflated in one call with
+# libdeflate when it is installed; larger ones keep streaming through zlib.
+# Each whole-buffer inflate holds its full output in memory, so at most
+# `_LIBDEFLATE_SLOTS` of them run at once regardless of the worker count.
+_LIBDEFLATE_MAX_SIZE = 16 << 20
+_LIBDEFLATE_SLOTS = 4
+_libdeflate_slots = threading.BoundedSemaphore(_LIBDEFLATE_SLOTS)
+
+# Buffer size for decompressed output, so inflated data reaches the OS in
+# large writes rather than the default 4-8 KiB pieces.
+_WRITE_BUFFER_SIZE = 1 << 18
+
+_OUTPUT_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _advise(mm: mmap.mmap, advice_name: str, start: int = 0, length: Optional[int] = None) -> None:
+    """Pass an madvise hint for a range of `mm` to the kernel.
+
+    `start` is rounded down to a page boundary as madvise requires. The hint
+    is skipped where the platform lacks madvise or the named advice (e.g.
+    Windows).
+    """
+    advice = getattr(mmap, advice_name, None)
+    if advice is None or not hasattr(mm, "madvise"):
+        return
+
+    aligned = start - start % mmap.PAGESIZE
+    if aligned < 0 or aligned >= len(mm):
+        return
+    available = len(mm) - aligned
+    length = available if length is None else min(length + start - aligned, available)
+    try:
+        mm.madvise(advice, aligned, length)
+    except OSError:
+        pass
+
+
+def _chunks(mm: mmap.mmap, offset: int, length: int) -> Iterator[bytes]:
+    """Yield `length` bytes of `mm` starting at `offset` in bounded chunks."""
+    end = offset + length
+    if offset < 0 or end > len(mm):
+        raise EOFError("Unexpected end of stream")
+    for start in range(offset, end, _CHUNK_SIZE):
+        yield mm[start : min(start + _CHUNK_SIZE, end)]
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of `data` to the file descriptor `fd`."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _copy_range(src_fd: int, mm: mmap.mmap, dst_fd: int, offset: int, length: int) -> None:
+    """Copy `length` bytes of the bundle starting at `offset` into `dst_fd`.
+
+    Uses `os.copy_file_range` so the data never leaves the kernel where that
+    is available, and finishes with a plain copy out of `mm` otherwise.
+    """
+    if offset < 0 or offset + length > len(mm):
+        raise EOFError("Unexpected end of stream")
+
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < length:
+                n = os.copy_file_range(src_fd, dst_fd, length - copied, offset + copied)
+                if n == 0:
+                    break
+                copied += n
+        except OSError:
+            # Not supported for this pair of files (e.g. older kernels or
+            # filesystems); fall through and copy the remainder ourselves.
+            pass
+
+    for chunk in _chunks(mm, offset + copied, length - copied):
+        _write_all(dst_fd, chunk)
+
+
+def _deflate_wbits(head: bytes) -> int:
+    """Choose the zlib `wbits` for a deflate stream from its first two bytes.
+
+    A zlib header is a CMF byte declaring method 8 (deflate) with at most a
+    32 KiB window, followed by a FLG byte that makes the pair a multiple of
+    31. Anything else is treated as a headerless (raw DEFLATE) stream.
+    """
+    if len(head) == 2 and (head[0] & 0x0F) == 8 and (head[0] >> 4) <= 7 and ((head[0] << 8) | head[1]) % 31 == 0:
+        return zlib.MAX_WBITS
+    return -zlib.MAX_WBITS
+
+
+def _inflate_range(mm: mmap.mmap, dst: BinaryIO, offset: int, length: int, size: int) -> None:
+    """Decompress `length` bytes of deflate data at `offset` in `mm` into `dst`.
+
+    Both zlib-wrapped and headerless (raw DEFLATE) streams are accepted. Raises
+    `zlib.error` if the stream is truncated or does not inflate to exactly
+    `size` bytes.
+    """
+    decompressor = zlib.decompressobj(_deflate_wbits(mm[offset : offset + min(length, 2)]))
+    written = 0
+    for chunk in _chunks(mm, offset, length):
+        written += dst.write(decompressor.decompress(chunk))
+    written += dst.write(decompressor.flush())
+
+    if not decompressor.eof:
+        raise zlib.error("Error -5 while decompressing data: incomplete or truncated stream")
+    if written != size:
+        raise zlib.error(f"Decompressed {written} bytes, expected {size}")
+
+
+def _inflate_whole(mm: mmap.mmap, dst: BinaryIO, offset: int, length: int, size: int) -> None:
+    """Decompress the deflate data at `offset` in `mm` into `dst` with libdeflate.
+
+    libdeflate only works on whole buffers and needs the decompressed `size`
+    up front, which every bundle entry records.
+    """
+    if offset < 0 or offset + length > len(mm):
+        raise EOFError("Unexpected end of stream")
+    # Work on a view of the mapping rather than a copy; both views must be
+    # released before the mapping can be closed.
+    with _libdeflate_slots, memoryview(mm) as view, view[offset : offset + length] as data:
+        try:
+            if _deflate_wbits(data[:2]) > 0:
+                inflated = _libdeflate.zlib_decompress(data, size)
+            else:
+                inflated = _libdeflate.deflate_decompress(data, size)
+        except _libdeflate.DeflateError as exc:
+            raise zlib.error(str(exc)) from exc
+        # `size` only bounds libdeflate's output; hold it to the same
+        # exact-size check as the streaming zlib path.
+        if len(inflated) != size:
+            raise zlib.error(f"Decompressed {len(inflated)} bytes, expected {size}")
+        dst.write(inflated)
+
+
+def _extract_entry(src_fd: int, mm: mmap.mmap, entry: BundleFileEntry, out_path: str) -> None:
+    """Write the contents of `entry` from the bundle to `out_path`."""
+    if entry.compressed_size and entry.compressed_size != 0:
+        with open(out_path, "wb", buffering=_WRITE_BUFFER_SIZE) as out_fh:
+            if _libdeflate is not None and entry.size <= _LIBDEFLATE_MAX_SIZE:
+                _inflate_whole(mm, out_fh, entry.offset, entry.compressed_size, entry.size)
+            else:
+                _inflate_range(mm, out_fh, entry.offset, entry.compressed_size, entry.size)
+        return
+
+    out_fd = os.open(out_path, _OUTPUT_FLAGS, 0o666)
+    try:
+        _copy_range(src_fd, mm, out_fd, entry.offset, entry.size)
+    finally:
+        os.close(out_fd)
+
 
 class Bundle:
     """Represents a parsed self-contained .NET bundle.
@@ -38,49 +210,54 @@ class Bundle:
 
         Returns the offset (int) if found, otherwise None.
         """
-        test_guid_bytes = bytes(
-            [
-                0x33, 0x38, 0x63, 0x63, 0x38, 0x32, 0x37, 0x2d, 0x65, 0x33, 0x34, 0x66,
-                0x2d, 0x34, 0x34, 0x35, 0x33, 0x2d, 0x39, 0x64, 0x66, 0x34, 0x2d, 0x31,
-                0x65, 0x37, 0x39, 0x36, 0x65, 0x39, 0x66, 0x31, 0x64, 0x30, 0x37,
-            ]
-        )
-
         with open(bundle_path, "rb") as fh:
-            data = fh.read()
+            # PE header location at 0x3c
+            if os.fstat(fh.fileno()).st_size < 0x40:
+                return None
 
-        # PE header location at 0x3c
-        if len(data) < 0x40:
-            return None
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
 
-        pe_offset = struct.unpack_from("<I", data, 0x3C)[0]
-        pe_machine_type = struct.unpack_from("<H", data, pe_offset + 4)[0]
+        try:
+            pe_offset = struct.unpack_from("<I", mm, 0x3C)[0]
+            pe_machine_type = struct.unpack_from("<H", mm, pe_offset + 4)[0]
 
-        guid_bundle_offset = (
-            (0x1 + 0x8 + 0x20 + 0x8) if pe_machine_type == 0x14C else (0x1 + 0x10 + 0x20 + 0x8)
-        )
+            guid_bundle_offset = (
+                (0x1 + 0x8 + 0x20 + 0x8) if pe_machine_type == 0x14C else (0x1 + 0x10 + 0x20 + 0x8)
+            )
 
-        idx = data.find(test_guid_bytes)
-        if idx == -1:
-            return None
+            idx = mm.find(_BUNDLE_MARKER)
+            if idx == -1:
+                return None
 
-        # Read little-endian 32-bit integer at the computed location
-        target_index = idx - guid_bundle_offset
-        if target_index < 0 or target_index + 4 > len(data):
-            return None
+            # Read little-endian 32-bit integer at the computed location
+            target_index = idx - guid_bundle_offset
+            if target_index < 0 or target_index + 4 > len(mm):
+                return None
 
-        bundle_offset = struct.unpack_from("<i", data, target_index)[0]
-        return bundle_offset
+            bundle_offset = struct.unpack_from("<i", mm, target_index)[0]
+            return bundle_offset
+        finally:
+            mm.close()
 
     def read_bundle(self) -> bool:
         """Parse the bundle header and entries. Returns True on success."""
         with open(self._bundle_path, "rb") as fh:
-            data = fh.read()
+            # An empty file cannot be mapped, and has no header to parse.
+            if os.fstat(fh.fileno()).st_size == 0:
+                print("Error while parsing bundle header.")
+                print("Unexpected end of stream")
+                return False
 
-        stream = BytesIO(data)
-        reader = BinaryReader(stream)
-        reader.seek(self._bundle_offset)
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
 
+        try:
+            with BinaryReader(mm, self._bundle_offset) as reader:
+                return self._parse(reader, mm)
+        finally:
+            mm.close()
+
+    def _parse(self, reader: BinaryReader, mm: mmap.mmap) -> bool:
+        """Parse the header and entry table from `reader`, a view over `mm`."""
         try:
             self.header = BundleHeader.from_reader(reader)
         except Exception as exc:  # pylint: disable=broad-except
@@ -93,43 +270,60 @@ class Bundle:
         print(f"Version: {self.header.major_version}.{self.header.minor_version}")
         print(f"Embedded files count: {self.header.embedded_files_count}")
 
+        # Ask for the entry table up front rather than faulting it in page by page.
+        _advise(mm, "MADV_WILLNEED", reader.tell(), self.header.embedded_files_count * _ENTRY_SIZE_ESTIMATE)
+
         try:
-            for _ in range(self.header.embedded_files_count):
-                entry = BundleFileEntry.from_reader(reader, self.header.major_version)
-                print(f"Embedded file info: Name: {entry.relative_path}, Size: {entry.size}, Type: {entry.type}")
-                self.embedded_files.append(entry)
+            self.embedded_files = BundleFileEntry.read_all(
+                reader, self.header.major_version, self.header.embedded_files_count
+            )
         except Exception as exc:  # pylint: disable=broad-except
             print("Error while parsing embedded bundle files.")
             print(str(exc))
             return False
 
+        if logger.isEnabledFor(logging.DEBUG):
+            for entry in self.embedded_files:
+                logger.debug(
+                    f"Embedded file info: Name: {os.fsdecode(entry.relative_path)}, Size: {entry.size}, Type: {entry.type}"
+                )
+
         return True
 
     def extract_files(self, output_directory: str) -> None:
         """Extract all parsed embedded files into `output_directory`."""
         os.makedirs(output_directory, exist_ok=True)
 
-        with open(self._bundle_path, "rb") as fh:
-            for entry in self.embedded_files:
-                out_path = os.path.join(output_directory, entry.relative_path)
-                os.makedirs(os.path.dirname(out_path), exist_ok=True)
-
-                fh.seek(entry.offset)
-                if entry.compressed_size and entry.compressed_size != 0:
-                    compressed = fh.read(entry.compressed_size)
-                    # zlib headerless stream may be used in some bundles; the C# code
-                    # uses a ZLibStream wrapper that expects zlib-wrapped data.
-                    try:
-                        decompressed = zlib.decompress(compressed)
-                    except zlib.error:
-                        # Try raw DEFLATE stream
-                        decompressed = zlib.decompress(compressed, -zlib.MAX_WBITS)
-
-                    with open(out_path, "wb") as out_fh:
-                        out_fh.write(decompressed)
-                else:
-                    data = fh.read(entry.size)
-                    with open(out_path, "wb") as out_fh:
-                        out_fh.write(data)
-
-                print(f"Successfully extracted file {entry.relative_path}.")
+        out_paths = [
+            os.path.join(output_directory, os.fsdecode(entry.relative_path)) for entry in self.embedded_files
+        ]
+        # Many entries share a directory; create each distinct one only once.
+        # Shorter paths first, so nested directories find their parents in place.
+        for directory in sorted({os.path.dirname(out_path) for out_path in out_paths}, key=len):
+            os.makedirs(directory, exist_ok=True)
+
+        with open(self._bundle_path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Entries are laid out, and consumed, in roughly ascending offset
+            # order; let the kernel read ahead aggressively.
+            _advise(mm, "MADV_SEQUENTIAL")
+
+            # Entries are independent: zlib and file writes release the GIL, so
+            # extracting them concurrently overlaps decompression with output I/O.
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                futures = [
+                    pool.submit(_extract_entry, fh.fileno(), mm, entry, out_path)
+                    for entry, out_path in zip(self.embedded_files, out_paths)
+                ]
+                debug = logger.isEnabledFor(logging.DEBUG)
+                try:
+                    for entry, future in zip(self.embedded_files, futures):
+                        future.result()
+                        if debug:
+                            logger.debug(f"Successfully extracted file {os.fsdecode(entry.relative_path)}.")
+                except BaseException:
+                    # Stop at the first failing entry: drop the tasks that have
+                    # not started instead of extracting the rest of the bundle.
+                    pool.shutdown(cancel_futures=True)
+                    raise
+
+        print(f"Successfully extracted {len(self.embedded_files)} files to {output_directory}.")
@@ -5,11 +5,17 @@ original C# implementation.
 """
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
 from enum import IntEnum
+from typing import List
 
 from .binary_reader import BinaryReader
 
+# Fixed-layout entry prefix: offset, size, [compressed size,] type.
+_ENTRY_V6 = struct.Struct("<qqqB")
+_ENTRY_V2 = struct.Struct("<qqB")
+
 
 class FileType(IntEnum):
     UNKNOWN = 0
@@ -21,13 +27,19 @@ class FileType(IntEnum):
     LAST = 6
 
 
-@dataclass
+# Type byte -> FileType, avoiding the enum's by-value lookup (and the
+# exception raised for unknown values) for every parsed entry.
+_FILE_TYPES = {member.value: member for member in FileType}
+
+
+@dataclass(slots=True, frozen=True)
 class BundleFileEntry:
     offset: int
     size: int
     compressed_size: int
     type: FileType
-    relative_path: str
+    # Raw UTF-8 path bytes as stored in the bundle; decode with os.fsdecode.
+    relative_path: bytes
 
     @property
     def is_valid(self) -> bool:
@@ -35,18 +47,89 @@ class BundleFileEntry:
 
     @classmethod
     def from_reader(cls, reader: BinaryReader, major_version: int) -> "BundleFileEntry":
-        offset = reader.read_int64()
-        size = reader.read_int64()
+        if major_version == 6:
+            offset, size, compressed, type_byte = reader.read_struct(_ENTRY_V6)
+        else:
+            offset, size, type_byte = reader.read_struct(_ENTRY_V2)
+            compressed = -1
+
+        relative = reader.read_path_bytes()
+        # Paths stay as bytes, but must still be valid UTF-8.
+        relative.decode("utf-8")
+
+        return cls._create(offset, size, compressed, type_byte, relative)
+
+    @classmethod
+    def read_all(cls, reader: BinaryReader, major_version: int, count: int) -> List["BundleFileEntry"]:
+        """Parse `count` consecutive entries from `reader`.
 
-        compressed = reader.read_int64() if major_version == 6 else -1
+        Equivalent to calling `from_reader` `count` times. For buffer-backed
+        readers the entry table is walked directly on the buffer, with the
+        path-length varint decoded inline rather than through per-field
+        reader calls. Paths are kept as raw bytes, validated as UTF-8 in a
+        single pass once the table has been read.
+        """
+        buf = reader.buffer
+        if buf is None:
+            return [cls.from_reader(reader, major_version) for _ in range(count)]
 
-        type_byte = reader.read_byte()
+        v6 = major_version == 6
+        fixed = _ENTRY_V6 if v6 else _ENTRY_V2
+        unpack_from = fixed.unpack_from
+        fixed_size = fixed.size
+        end = len(buf)
+        pos = reader.tell()
+
+        # The count is known up front, so fill a pre-sized list in place.
+        entries: List["BundleFileEntry"] = [None] * count  # type: ignore[list-item]
+        for i in range(count):
+            # Fixed fields plus at least one byte of path length.
+            if pos < 0 or pos + fixed_size + 1 > end:
+                raise EOFError("Unexpected end of stream")
+            if v6:
+                offset, size, compressed, type_byte = unpack_from(buf, pos)
+            else:
+                offset, size, type_byte = unpack_from(buf, pos)
+                compressed = -1
+            pos += fixed_size
+
+            # Same two-byte path length encoding as BinaryReader.read_path_length.
+            length = buf[pos]
+            pos += 1
+            if length & 0x80:
+                if pos >= end:
+                    raise EOFError("Unexpected end of stream")
+                second = buf[pos]
+                pos += 1
+                if second & 0x80:
+                    raise ValueError("Bundle path length attempted to read beyond two bytes.")
+                length = (second << 7) | (length & 0x7F)
+            if length <= 0 or length > 4095:
+                raise ValueError("Read invalid path length from bundle.")
+            if pos + length > end:
+                raise EOFError("Unexpected end of stream")
+            relative = bytes(buf[pos : pos + length])
+            pos += length
+
+            entries[i] = cls._create(offset, size, compressed, type_byte, relative)
+
+        # Validate every path as UTF-8 in one decode; the NUL separator keeps a
+        # multi-byte sequence from spanning two paths. On failure, decode the
+        # paths one by one to raise the same error `from_reader` would.
         try:
-            ftype = FileType(type_byte)
-        except ValueError:
-            ftype = FileType.UNKNOWN
+            b"\0".join([entry.relative_path for entry in entries]).decode("utf-8")
+        except UnicodeDecodeError:
+            for entry in entries:
+                entry.relative_path.decode("utf-8")
+            raise
+
+        reader.seek(pos)
+        return entries
 
-        relative = reader.read_path_string()
+    @classmethod
+    def _create(cls, offset: int, size: int, compressed: int, type_byte: int, relative: bytes) -> "BundleFileEntry":
+        """Build a validated entry from its raw field values."""
+        ftype = _FILE_TYPES.get(type_byte, FileType.UNKNOWN)
 
         entry = cls(offset=offset, size=size, compressed_size=compressed, type=ftype, relative_path=relative)
 
@@ -5,13 +5,17 @@ its substructures. Parsing is performed from a `BinaryReader` instance.
 """
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
-from typing import BinaryIO
 
 from .binary_reader import BinaryReader
 
+# Fixed-layout header prefix: major version, minor version, embedded file count.
+_HDR_FIXED = struct.Struct("<IIi")
+_LOCATION = struct.Struct("<qq")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Location:
     offset: int
     size: int
@@ -22,10 +26,11 @@ class Location:
 
     @classmethod
     def from_reader(cls, reader: BinaryReader) -> "Location":
-        return cls(offset=reader.read_int64(), size=reader.read_int64())
+        offset, size = reader.read_struct(_LOCATION)
+        return cls(offset=offset, size=size)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BundleHeader:
     major_version: int
     minor_version: int
@@ -37,29 +42,17 @@ class BundleHeader:
 
     @property
     def is_valid(self) -> bool:
-        return (
-            self.embedded_files_count > 0
-            and self.minor_version == 0
-            and self.major_version in (6, 2)
-        )
+        return self._is_valid(self.major_version, self.minor_version, self.embedded_files_count)
+
+    @staticmethod
+    def _is_valid(major: int, minor: int, embedded: int) -> bool:
+        return embedded > 0 and minor == 0 and major in (6, 2)
 
     @classmethod
     def from_reader(cls, reader: BinaryReader) -> "BundleHeader":
-        major = reader.read_uint32()
-        minor = reader.read_uint32()
-        embedded = reader.read_int32()
-
-        header = cls(
-            major_version=major,
-            minor_version=minor,
-            embedded_files_count=embedded,
-            bundle_id="",
-            deps_json_location=Location(0, 0),
-            runtime_config_json_location=Location(0, 0),
-            flags=0,
-        )
+        major, minor, embedded = reader.read_struct(_HDR_FIXED)
 
-        if not header.is_valid:
+        if not cls._is_valid(major, minor, embedded):
             raise ValueError(
                 f"Failed to parse bundle. Parsed data: Version: {major}.{minor}, Embedded file count: {embedded}"
             )
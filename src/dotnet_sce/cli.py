@@ -6,8 +6,10 @@ behaviour: detect or accept a bundle offset and extract files.
 from __future__ import annotations
 
 import argparse
+import logging
 import sys
 
+from . import offset_cache
 from .bundle import Bundle
 
 
@@ -28,18 +30,33 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("file", help="Path to self-contained executable")
     parser.add_argument("output_dir", help="Directory to extract files into")
     parser.add_argument("--offset", type=parse_offset, help="Bundle offset (decimal or 0xHEX)")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Always scan for the bundle offset instead of using the offset cache"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print details for every embedded file")
 
     args = parser.parse_args(argv)
 
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+
     offset = args.offset
+    if offset is None and not args.no_cache:
+        offset = offset_cache.lookup_offset(args.file)
+        if offset is not None:
+            print(f"Using cached bundle offset: {offset:#x}")
+
     if offset is None:
-        found = Bundle.find_bundle_offset(args.input_path)
+        found = Bundle.find_bundle_offset(args.file)
         if found is None:
             print("Failed to automatically locate bundle offset.")
             return 2
         offset = found
+        print(f"Detected bundle offset: {offset:#x} (pass --offset {offset:#x} to skip detection)")
+        if not args.no_cache:
+            offset_cache.store_offset(args.file, offset)
 
-    bundle = Bundle(args.input_path, offset)
+    bundle = Bundle(args.file, offset)
     if not bundle.read_bundle():
         return 1
 
@@ -0,0 +1,63 @@
+"""On-disk cache of automatically detected bundle offsets.
+
+Offsets are stored in a small JSON file under the user's cache directory
+(`$XDG_CACHE_HOME/dotnet_sce/offsets.json`, defaulting to `~/.cache`), keyed
+by the executable's absolute path. An entry is only reused while the file's
+size and modification time are unchanged. The cache is best-effort: errors
+reading or writing it are ignored.
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import Optional
+
+
+def cache_path() -> str:
+    """Return the location of the offset cache file."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "dotnet_sce", "offsets.json")
+
+
+def _load() -> dict:
+    try:
+        with open(cache_path(), "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def lookup_offset(bundle_path: str) -> Optional[int]:
+    """Return the cached offset for `bundle_path`, or None if absent or stale."""
+    try:
+        st = os.stat(bundle_path)
+    except OSError:
+        return None
+
+    entry = _load().get(os.path.abspath(bundle_path))
+    if (
+        isinstance(entry, dict)
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and entry.get("size") == st.st_size
+        and isinstance(entry.get("offset"), int)
+    ):
+        return entry["offset"]
+    return None
+
+
+def store_offset(bundle_path: str, offset: int) -> None:
+    """Record `offset` as the bundle offset of `bundle_path`."""
+    try:
+        st = os.stat(bundle_path)
+        path = cache_path()
+        data = _load()
+        data[os.path.abspath(bundle_path)] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "offset": offset}
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
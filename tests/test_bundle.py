@@ -0,0 +1,118 @@
+"""Tests for the extraction helpers in `dotnet_sce.bundle`."""
+from __future__ import annotations
+
+import dataclasses
+import mmap
+import zlib
+
+import pytest
+
+from dotnet_sce import bundle
+from dotnet_sce.bundle import _deflate_wbits
+from dotnet_sce.bundle_file_entry import BundleFileEntry, FileType
+
+PAYLOADS = [b"", b"a", b"hello world" * 100, bytes(range(256)) * 64]
+
+
+def _compress(data: bytes, wbits: int, level: int = 6) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+    return compressor.compress(data) + compressor.flush()
+
+
+@pytest.mark.parametrize("data", PAYLOADS)
+@pytest.mark.parametrize("level", [0, 1, 6, 9])
+@pytest.mark.parametrize("window", [9, 12, 15])
+def test_deflate_wbits_zlib(data, level, window):
+    stream = _compress(data, window, level)
+    assert _deflate_wbits(stream[:2]) == zlib.MAX_WBITS
+    assert zlib.decompress(stream, _deflate_wbits(stream[:2])) == data
+
+
+@pytest.mark.parametrize("data", PAYLOADS)
+@pytest.mark.parametrize("level", [0, 1, 6, 9])
+def test_deflate_wbits_raw(data, level):
+    stream = _compress(data, -zlib.MAX_WBITS, level)
+    assert _deflate_wbits(stream[:2]) == -zlib.MAX_WBITS
+    assert zlib.decompress(stream, _deflate_wbits(stream[:2])) == data
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        b"",
+        b"\x78",  # too short
+        b"\x78\x9d",  # check bits wrong
+        b"\x79\x18",  # method 9, not deflate
+        b"\x88\x98",  # window larger than 32 KiB
+    ],
+)
+def test_deflate_wbits_not_zlib(head):
+    assert _deflate_wbits(head) == -zlib.MAX_WBITS
+
+
+DATA = bytes(range(256)) * 4096
+
+
+@pytest.fixture(params=["zlib", "libdeflate"])
+def backend(request, monkeypatch):
+    """Run a test with each decompression backend."""
+    if request.param == "libdeflate":
+        monkeypatch.setattr(bundle, "_libdeflate", pytest.importorskip("deflate"))
+    else:
+        monkeypatch.setattr(bundle, "_libdeflate", None)
+    return request.param
+
+
+@pytest.fixture
+def image(tmp_path):
+    """A mapped file holding DATA stored plain, zlib-wrapped and raw-deflated."""
+    parts = [b"\0" * 16, DATA, _compress(DATA, zlib.MAX_WBITS), _compress(DATA, -zlib.MAX_WBITS)]
+    entries = {}
+    pos = 0
+    for name, part in zip(["pad", "plain", "zlib", "raw"], parts):
+        entries[name] = (pos, len(part))
+        pos += len(part)
+
+    path = tmp_path / "bundle.bin"
+    path.write_bytes(b"".join(parts))
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield fh.fileno(), mm, entries
+
+
+def _extract(image, tmp_path, name, compressed, **changes):
+    src_fd, mm, entries = image
+    offset, length = entries[name]
+    entry = BundleFileEntry(
+        offset=offset,
+        size=len(DATA),
+        compressed_size=length if compressed else 0,
+        type=FileType.UNKNOWN,
+        relative_path=name.encode(),
+    )
+    out_path = str(tmp_path / "out")
+    bundle._extract_entry(src_fd, mm, dataclasses.replace(entry, **changes), out_path)
+    with open(out_path, "rb") as fh:
+        return fh.read()
+
+
+@pytest.mark.parametrize("name", ["zlib", "raw"])
+def test_extract_compressed(backend, image, tmp_path, name):
+    assert _extract(image, tmp_path, name, True) == DATA
+
+
+def test_extract_plain(image, tmp_path):
+    assert _extract(image, tmp_path, "plain", False) == DATA
+
+
+@pytest.mark.parametrize("name", ["zlib", "raw"])
+@pytest.mark.parametrize("field, delta", [("compressed_size", -100), ("size", 1), ("size", -1)])
+def test_extract_rejects_wrong_sizes(backend, image, tmp_path, name, field, delta):
+    value = len(DATA) if field == "size" else image[2][name][1]
+    with pytest.raises(zlib.error):
+        _extract(image, tmp_path, name, True, **{field: value + delta})
+
+
+@pytest.mark.parametrize("name, compressed", [("plain", False), ("zlib", True), ("raw", True)])
+def test_extract_rejects_entries_past_end(backend, image, tmp_path, name, compressed):
+    with pytest.raises(EOFError):
+        _extract(image, tmp_path, name, compressed, offset=len(image[1]) - 10)
@@ -0,0 +1,108 @@
+"""Tests for parsing bundle file entries.
+
+`BundleFileEntry.read_all` walks buffer-backed entry tables directly, so these
+tests check it against repeated `from_reader` calls for both reader kinds and
+both entry layouts.
+"""
+from __future__ import annotations
+
+import io
+import struct
+
+import pytest
+
+from dotnet_sce.binary_reader import BinaryReader
+from dotnet_sce.bundle_file_entry import BundleFileEntry, FileType
+
+
+def _path_length(length: int) -> bytes:
+    """Encode `length` with the bundle's two-byte path length format."""
+    if length < 0x80:
+        return bytes([length])
+    return bytes([(length & 0x7F) | 0x80, length >> 7])
+
+
+def _entry(major: int, path: bytes, offset: int = 0x100, size: int = 10, type_byte: int = 1) -> bytes:
+    if major == 6:
+        fixed = struct.pack("<qqqB", offset, size, 0, type_byte)
+    else:
+        fixed = struct.pack("<qqB", offset, size, type_byte)
+    return fixed + _path_length(len(path)) + path
+
+
+def _parse(raw: bytes, major: int, count: int, use_read_all: bool, stream: bool):
+    """Parse `count` entries from `raw`, returning (entries, end) or the error."""
+    reader = BinaryReader(io.BytesIO(raw) if stream else raw)
+    try:
+        if use_read_all:
+            entries = BundleFileEntry.read_all(reader, major, count)
+        else:
+            entries = [BundleFileEntry.from_reader(reader, major) for _ in range(count)]
+    except Exception as exc:  # pylint: disable=broad-except
+        return type(exc), str(exc)
+    return entries, reader.tell()
+
+
+def _assert_same(raw: bytes, major: int, count: int):
+    """Check every parser/reader combination agrees, and return their result."""
+    results = [
+        _parse(raw, major, count, use_read_all, stream)
+        for use_read_all in (False, True)
+        for stream in (False, True)
+    ]
+    for result in results[1:]:
+        assert result == results[0]
+    return results[0]
+
+
+VALID_PATHS = [b"app.dll", "données/é.txt".encode("utf-8"), b"d/" + b"x" * 200, b"y" * 4095]
+
+
+@pytest.mark.parametrize("major", [6, 2])
+def test_valid_table(major):
+    raw = b"".join(_entry(major, path, offset=0x100 + i) for i, path in enumerate(VALID_PATHS))
+    result = _assert_same(raw, major, len(VALID_PATHS))
+
+    if major == 6:
+        entries, end = result
+        assert end == len(raw)
+        assert [entry.relative_path for entry in entries] == VALID_PATHS
+        assert all(entry.type is FileType.ASSEMBLY for entry in entries)
+
+
+def test_unknown_type_byte():
+    entries, _ = _assert_same(_entry(6, b"a", type_byte=0x7F), 6, 1)
+    assert entries[0].type is FileType.UNKNOWN
+
+
+@pytest.mark.parametrize("major", [6, 2])
+@pytest.mark.parametrize(
+    "tail, error",
+    [
+        (b"\x00", ValueError),  # zero length
+        (b"\x80\x20" + b"z" * 4096, ValueError),  # longer than 4095
+        (b"\x81\x81\x01", ValueError),  # length runs past two bytes
+        (b"\x85", EOFError),  # second length byte missing
+        (b"\x05abc", EOFError),  # truncated mid-path
+        (b"\x02\xc3(", UnicodeDecodeError),  # not UTF-8
+    ],
+)
+def test_invalid_path(major, tail, error):
+    raw = _entry(major, b"ok.dll") + _entry(major, b"")[:-1] + tail
+    result = _assert_same(raw, major, 2)
+    if major == 6:
+        assert result[0] is error
+
+
+@pytest.mark.parametrize("major", [6, 2])
+def test_truncated_fixed_fields(major):
+    raw = _entry(major, b"ok.dll") + _entry(major, b"next")[:10]
+    result = _assert_same(raw, major, 2)
+    if major == 6:
+        assert result[0] is EOFError
+
+
+def test_invalid_entry():
+    result = _assert_same(_entry(6, b"a", size=0), 6, 1)
+    assert result[0] is ValueError
+    assert result[1].startswith("Failed to parse bundle file entry.")
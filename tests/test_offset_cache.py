@@ -0,0 +1,74 @@
+"""Tests for the on-disk bundle offset cache."""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from dotnet_sce import offset_cache
+
+
+@pytest.fixture
+def bundle(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = tmp_path / "app.exe"
+    path.write_bytes(b"MZ" + b"\0" * 126)
+    return str(path)
+
+
+def test_cache_path_uses_xdg_cache_home(bundle, tmp_path):
+    assert offset_cache.cache_path() == str(tmp_path / "cache" / "dotnet_sce" / "offsets.json")
+
+
+def test_round_trip(bundle):
+    assert offset_cache.lookup_offset(bundle) is None
+    offset_cache.store_offset(bundle, 0x1234)
+    assert offset_cache.lookup_offset(bundle) == 0x1234
+
+
+def test_stale_after_mtime_change(bundle):
+    offset_cache.store_offset(bundle, 0x1234)
+    st = os.stat(bundle)
+    os.utime(bundle, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert offset_cache.lookup_offset(bundle) is None
+
+
+def test_stale_after_size_change(bundle):
+    offset_cache.store_offset(bundle, 0x1234)
+    st = os.stat(bundle)
+    with open(bundle, "ab") as fh:
+        fh.write(b"\0")
+    # Keep the mtime so only the size differs.
+    os.utime(bundle, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert offset_cache.lookup_offset(bundle) is None
+
+
+@pytest.mark.parametrize("content", [b"", b"{not json", b"[1, 2]", b"\xff\xfe", b'{"x": 1}'])
+def test_corrupt_cache_file(bundle, content):
+    path = offset_cache.cache_path()
+    os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as fh:
+        fh.write(content)
+
+    assert offset_cache.lookup_offset(bundle) is None
+    # Storing replaces the unreadable cache.
+    offset_cache.store_offset(bundle, 0x1234)
+    assert offset_cache.lookup_offset(bundle) == 0x1234
+
+
+def test_non_integer_offset(bundle):
+    st = os.stat(bundle)
+    entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "offset": "0x1234"}
+    os.makedirs(os.path.dirname(offset_cache.cache_path()))
+    with open(offset_cache.cache_path(), "w", encoding="utf-8") as fh:
+        json.dump({os.path.abspath(bundle): entry}, fh)
+    assert offset_cache.lookup_offset(bundle) is None
+
+
+def test_missing_bundle(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    missing = str(tmp_path / "missing.exe")
+    assert offset_cache.lookup_offset(missing) is None
+    offset_cache.store_offset(missing, 0x1234)
+    assert not os.path.exists(offset_cache.cache_path())